@@ -114,17 +114,31 @@ def create_search_api_spec():
     )
 
 
+def get_backend_type(flask_app):
+    """
+    Get the type of backend that the DataGateway API should use. If the Flask app has
+    been set up by an automated test, the backend type is taken from the app's config
+    (and set in the API's config), otherwise the backend type from `config.json` is used
+
+    :param flask_app: The Flask app the API is being set up on
+    :type flask_app: :class:`flask.app.Flask`
+    :return: The backend type e.g. "db" or "python_icat"
+    """
+    backend_type = flask_app.config.get("TEST_BACKEND")
+    if backend_type is None:
+        return Config.config.datagateway_api.backend
+
+    Config.config.datagateway_api.set_backend_type(backend_type)
+    return backend_type
+
+
 def create_app_infrastructure(flask_app):
     CORS(flask_app)
     flask_app.url_map.strict_slashes = False
     api = CustomErrorHandledApi(flask_app)
 
     if Config.config.datagateway_api is not None:
-        try:
-            backend_type = flask_app.config["TEST_BACKEND"]
-            Config.config.datagateway_api.set_backend_type(backend_type)
-        except KeyError:
-            backend_type = Config.config.datagateway_api.backend
+        backend_type = get_backend_type(flask_app)
 
         if backend_type == "db":
             flask_app.config[
@@ -154,11 +168,7 @@ def create_api_endpoints(flask_app, api, specs):
         datagateway_api_spec = next(
             (spec for spec in specs if spec.title == "DataGateway API"), None,
         )
-        try:
-            backend_type = flask_app.config["TEST_BACKEND"]
-            Config.config.datagateway_api.set_backend_type(backend_type)
-        except KeyError:
-            backend_type = Config.config.datagateway_api.backend
+        backend_type = get_backend_type(flask_app)
 
         backend = create_backend(backend_type)
 
@@ -52,6 +52,10 @@ class DataGatewayAPI(BaseModel):
     extension: StrictStr
     icat_check_cert: Optional[StrictBool]
     icat_url: Optional[StrictStr]
+    # When `False`, records updated using the `python_icat` backend are converted
+    # locally rather than being re-obtained from ICAT, so the response won't contain
+    # any changes ICAT makes to the data (e.g. meta attributes such as `modTime`)
+    refetch_updated_entities: StrictBool = True
 
     _validate_extension = validator("extension", allow_reuse=True)(validate_extension)
 
@@ -102,9 +106,9 @@ class DataGatewayAPI(BaseModel):
         """
         This setter is used as a way for automated tests to set the backend type. The
         API can detect if the Flask app setup is from an automated test by checking the
-        app's config for a `TEST_BACKEND`. If this value exists (a KeyError will be
-        raised when the API is run normally, which will then grab the backend type from
-        `config.json`), it needs to be set using this function. This is required because
+        app's config for a `TEST_BACKEND`. If this value exists (it won't when the API
+        is run normally, in which case the backend type from `config.json` is used), it
+        needs to be set using this function. This is required because
         creating filters in the `QueryFilterFactory` is backend-specific so the backend
         type must be fetched. This must be done using this module (rather than directly
         importing and checking the Flask app's config) to avoid circular import issues.
@@ -186,10 +190,42 @@ class APIConfig(BaseModel):
         try:
             with open(path, encoding="utf-8") as target:
                 data = json.load(target)
-                return cls(**data)
+            return cls(**data)
         except (IOError, ValidationError) as error:
             sys.exit(f"An error occurred while trying to load the config data: {error}")
 
+    @validator("log_level")
+    def validate_log_level(cls, value):  # noqa: B902, N805
+        """
+        Checks that the log level is one recognised by Python's logging module. An error
+        is raised, at which point the application exits, if the level is unknown. This
+        means an invalid level is caught when the config is loaded, rather than when the
+        logger is set up.
+
+        :param cls: :class:`APIConfig` pointer
+        :param value: The value of the given config field
+        """
+        if not isinstance(logging.getLevelName(value), int):
+            raise ValueError(f"'{value}' is not a valid logging level")
+
+        return value
+
+    @validator("port")
+    def validate_port(cls, value):  # noqa: B902, N805
+        """
+        Checks that the port is a number within the range of valid TCP ports. An error
+        is raised, at which point the application exits, if the port is invalid. This
+        means an invalid port is caught when the config is loaded, rather than when the
+        Flask app is started.
+
+        :param cls: :class:`APIConfig` pointer
+        :param value: The value of the given config field
+        """
+        if value is not None and (not value.isdigit() or not 0 < int(value) < 65536):
+            raise ValueError(f"'{value}' is not a valid port number")
+
+        return value
+
     @validator("search_api")
     def validate_api_extensions(cls, value, values):  # noqa: B902, N805
         """
@@ -1,8 +1,12 @@
 from dateutil.parser import parse
+from dateutil.tz import tzlocal
 from icat import helper
 
 from datagateway_api.src.common.exceptions import BadRequestError
 
+# Created once as `tzlocal()` looks up the local timezone each time it's instantiated
+LOCAL_TIMEZONE = tzlocal()
+
 
 class DateHandler:
     """
@@ -68,3 +72,20 @@ class DateHandler:
         :return: Datetime (of type string) in the agreed format
         """
         return datetime_obj.isoformat(" ")
+
+    @staticmethod
+    def add_local_timezone(datetime_obj):
+        """
+        Add the local timezone to a datetime object which doesn't contain timezone info.
+        This makes datetimes from the DB backend consistent with those from the Python
+        ICAT backend. Datetime objects that already have timezone info are returned
+        unchanged
+
+        :param datetime_obj: Datetime object from a database query result
+        :type datetime_obj: :class:`datetime.datetime`
+        :return: Datetime object which contains timezone info
+        """
+        if datetime_obj.tzinfo is None:
+            return datetime_obj.replace(tzinfo=LOCAL_TIMEZONE)
+
+        return datetime_obj
@@ -1,11 +1,10 @@
 import logging
 
 from datagateway_api.src.common.config import Config
+from datagateway_api.src.common.filters import FilterKind
 from datagateway_api.src.datagateway_api.icat.filters import (
     PythonICATIncludeFilter,
-    PythonICATLimitFilter,
     PythonICATOrderFilter,
-    PythonICATSkipFilter,
 )
 
 if Config.config.search_api:
@@ -122,37 +121,47 @@ class FilterOrderHandler(object):
         :type panosc_entity_name: :class:`str`
         """
 
-        icat_relations = mappings.get_icat_relations_for_panosc_non_related_fields(
+        icat_relations = mappings.get_unique_icat_relations_for_panosc_non_related_fields(  # noqa: B950
             panosc_entity_name,
         )
 
-        # Remove any duplicate ICAT relations
-        icat_relations = list(dict.fromkeys(icat_relations))
         if icat_relations:
-            self.filters.append(PythonICATIncludeFilter(icat_relations))
+            # A list is given to the filter as its included filters may be extended
+            # later on, whereas the cached relations must not be modified
+            self.filters.append(PythonICATIncludeFilter(list(icat_relations)))
 
-    def merge_python_icat_limit_skip_filters(self):
+    def classify_python_icat_filters(self):
         """
-        When there are both limit and skip filters in a request, merge them into the
-        limit filter and remove the skip filter from the instance
+        Go through the filters in a single pass to find the filters which need managing
+        before a query is made using the Python ICAT backend
+
+        :return: Tuple containing the skip filter (or `None`), the limit filter (or
+            `None`) and a flag to show whether any order filters are present
         """
-        log.info("Merging a PythonICATSkipFilter and PythonICATLimitFilter together")
         skip_filter = None
         limit_filter = None
+        order_filter_present = False
 
+        # Each filter's `kind` is compared as opposed to using `isinstance()` for each
+        # filter class. As well as Python ICAT filters, the search API gives this
+        # handler `NestedWhereFilters` objects, which are also WHERE filters
         for icat_filter in self.filters:
-            if isinstance(icat_filter, PythonICATSkipFilter):
+            if icat_filter.kind is FilterKind.SKIP:
                 skip_filter = icat_filter
-
-            if isinstance(icat_filter, PythonICATLimitFilter):
+            elif icat_filter.kind is FilterKind.LIMIT:
                 limit_filter = icat_filter
+            elif icat_filter.kind is FilterKind.ORDER:
+                order_filter_present = True
 
-        if skip_filter and limit_filter:
-            log.info("Merging skip filter with limit filter")
-            limit_filter.skip_value = skip_filter.skip_value
-            log.info("Removing skip filter from list of filters")
-            self.remove_filter(skip_filter)
-            log.debug("Filters: %s", self.filters)
+        return skip_filter, limit_filter, order_filter_present
+
+    def merge_python_icat_limit_skip_filters(self):
+        """
+        When there are both limit and skip filters in a request, merge them into the
+        limit filter and remove the skip filter from the instance
+        """
+        skip_filter, limit_filter, _ = self.classify_python_icat_filters()
+        self._merge_limit_skip_filters(skip_filter, limit_filter)
 
     def clear_python_icat_order_filters(self):
         """
@@ -162,12 +171,21 @@ class FilterOrderHandler(object):
         A reset is required because Python ICAT overwrites (as opposed to appending to
         it) the query's order list every time one is added to the query.
         """
-        log.debug("Resetting result order for the order filter")
+        _, _, order_filter_present = self.classify_python_icat_filters()
+        self._reset_order_filters(order_filter_present)
+
+    def _merge_limit_skip_filters(self, skip_filter, limit_filter):
+        log.info("Merging a PythonICATSkipFilter and PythonICATLimitFilter together")
+        if skip_filter and limit_filter:
+            log.info("Merging skip filter with limit filter")
+            limit_filter.skip_value = skip_filter.skip_value
+            log.info("Removing skip filter from list of filters")
+            self.remove_filter(skip_filter)
+            log.debug("Filters: %s", self.filters)
 
-        if any(
-            isinstance(icat_filter, PythonICATOrderFilter)
-            for icat_filter in self.filters
-        ):
+    def _reset_order_filters(self, order_filter_present):
+        log.debug("Resetting result order for the order filter")
+        if order_filter_present:
             PythonICATOrderFilter.result_order = []
             PythonICATOrderFilter.join_specs = {}
 
@@ -185,6 +203,11 @@ class FilterOrderHandler(object):
         """
 
         self.add_filters(filters)
-        self.merge_python_icat_limit_skip_filters()
-        self.clear_python_icat_order_filters()
+        (
+            skip_filter,
+            limit_filter,
+            order_filter_present,
+        ) = self.classify_python_icat_filters()
+        self._merge_limit_skip_filters(skip_filter, limit_filter)
+        self._reset_order_filters(order_filter_present)
         self.apply_filters(query)
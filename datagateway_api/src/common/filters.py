@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from enum import IntEnum
 import logging
 
 from datagateway_api.src.common.exceptions import BadRequestError, FilterError
@@ -6,6 +7,21 @@ from datagateway_api.src.common.exceptions import BadRequestError, FilterError
 log = logging.getLogger()
 
 
+class FilterKind(IntEnum):
+    """
+    The type of a filter, shared by each backend's implementation of that filter. This
+    allows filters to be identified by comparing their `kind`, rather than using
+    `isinstance()` against each backend's filter classes
+    """
+
+    WHERE = 1
+    DISTINCT = 2
+    ORDER = 3
+    SKIP = 4
+    LIMIT = 5
+    INCLUDE = 6
+
+
 class QueryFilter(ABC):
     @property
     @abstractmethod
@@ -18,6 +34,7 @@ class QueryFilter(ABC):
 
 
 class WhereFilter(QueryFilter):
+    kind = FilterKind.WHERE
     precedence = 1
 
     def __init__(self, field, value, operation):
@@ -41,6 +58,7 @@ class WhereFilter(QueryFilter):
 
 
 class DistinctFieldFilter(QueryFilter):
+    kind = FilterKind.DISTINCT
     precedence = 0
 
     def __init__(self, fields):
@@ -49,6 +67,7 @@ class DistinctFieldFilter(QueryFilter):
 
 
 class OrderFilter(QueryFilter):
+    kind = FilterKind.ORDER
     precedence = 2
 
     def __init__(self, field, direction):
@@ -57,6 +76,7 @@ class OrderFilter(QueryFilter):
 
 
 class SkipFilter(QueryFilter):
+    kind = FilterKind.SKIP
     precedence = 3
 
     def __init__(self, skip_value):
@@ -67,6 +87,7 @@ class SkipFilter(QueryFilter):
 
 
 class LimitFilter(QueryFilter):
+    kind = FilterKind.LIMIT
     precedence = 4
 
     def __init__(self, limit_value):
@@ -77,6 +98,7 @@ class LimitFilter(QueryFilter):
 
 
 class IncludeFilter(QueryFilter):
+    kind = FilterKind.INCLUDE
     precedence = 5
 
     def __init__(self, included_filters):
@@ -3,7 +3,6 @@ from functools import wraps
 import json
 import logging
 
-from dateutil.tz.tz import tzlocal
 from flask import request
 from flask_restful import reqparse
 import requests
@@ -195,8 +194,7 @@ def map_distinct_attributes_to_results(distinct_attributes, query_result):
         if isinstance(data, datetime):
             # Workaround for when this function is used on DB backend, where usually
             # `_make_serializable()` would fix tzinfo
-            if data.tzinfo is None:
-                data = data.replace(tzinfo=tzlocal())
+            data = DateHandler.add_local_timezone(data)
             data = DateHandler.datetime_object_to_str(data)
 
         # Attribute name is from the 'origin' entity (i.e. not a related entity)
@@ -3,7 +3,6 @@ from datetime import datetime
 from decimal import Decimal
 import enum
 
-from dateutil.tz import tzlocal
 from sqlalchemy import (
     BigInteger,
     Boolean,
@@ -81,7 +80,7 @@ class EntityHelper(ABC):
         """
         if isinstance(field, datetime):
             # Add timezone info to match ICAT backend
-            field = field.replace(tzinfo=tzlocal())
+            field = DateHandler.add_local_timezone(field)
             return DateHandler.datetime_object_to_str(field)
         elif isinstance(field, Decimal):
             return float(field)
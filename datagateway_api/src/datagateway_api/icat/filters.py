@@ -17,9 +17,21 @@ log = logging.getLogger()
 
 
 class PythonICATWhereFilter(WhereFilter):
-    def __init__(self, field, value, operation):
+    def __init__(self, field, value, operation, raw_value=False):
+        """
+        :param field: Name of the field to filter on
+        :type field: :class:`str`
+        :param value: Value to filter the field with
+        :param operation: Operation used to compare the field and value e.g. `eq`
+        :type operation: :class:`str`
+        :param raw_value: Flag to place the value into the JPQL condition as it is,
+            rather than as a quoted string literal. This must only be used by the API
+            itself (e.g. to compare a field with `o.startDate`), never for user input
+        :type raw_value: :class:`bool`
+        """
         super().__init__(field, value, operation)
         self.field = field
+        self.raw_value = raw_value
 
     def apply_filter(self, query):
         try:
@@ -48,15 +60,22 @@ class PythonICATWhereFilter(WhereFilter):
         # version. This will prevent a breaking change from occurring
         log.info("Creating condition for ICAT where filter")
         if self.operation == "eq":
-            where_filter = self.create_condition(self.field, "=", self.value)
+            where_filter = self.create_condition(
+                self.field, "=", self.value, raw_value=self.raw_value,
+            )
         elif self.operation in ["ne", "neq"]:
-            where_filter = self.create_condition(self.field, "!=", self.value)
+            where_filter = self.create_condition(
+                self.field, "!=", self.value, raw_value=self.raw_value,
+            )
         elif self.operation == "like":
             where_filter = self.create_condition(self.field, "like", f"%{self.value}%")
         elif self.operation == "ilike":
             self.field = f"UPPER({self.field})"
             where_filter = self.create_condition(
-                self.field, "like", f"UPPER('%{self.value}%')",
+                self.field,
+                "like",
+                f"UPPER('%{self.escape_quotes(self.value)}%')",
+                raw_value=True,
             )
         elif self.operation == "nlike":
             where_filter = self.create_condition(
@@ -65,45 +84,42 @@ class PythonICATWhereFilter(WhereFilter):
         elif self.operation == "nilike":
             self.field = f"UPPER({self.field})"
             where_filter = self.create_condition(
-                self.field, "not like", f"UPPER('%{self.value}%')",
+                self.field,
+                "not like",
+                f"UPPER('%{self.escape_quotes(self.value)}%')",
+                raw_value=True,
             )
         elif self.operation == "lt":
-            where_filter = self.create_condition(self.field, "<", self.value)
+            where_filter = self.create_condition(
+                self.field, "<", self.value, raw_value=self.raw_value,
+            )
         elif self.operation == "lte":
-            where_filter = self.create_condition(self.field, "<=", self.value)
+            where_filter = self.create_condition(
+                self.field, "<=", self.value, raw_value=self.raw_value,
+            )
         elif self.operation == "gt":
-            where_filter = self.create_condition(self.field, ">", self.value)
+            where_filter = self.create_condition(
+                self.field, ">", self.value, raw_value=self.raw_value,
+            )
         elif self.operation == "gte":
-            where_filter = self.create_condition(self.field, ">=", self.value)
+            where_filter = self.create_condition(
+                self.field, ">=", self.value, raw_value=self.raw_value,
+            )
         elif self.operation in ["in", "inq"]:
-            # Convert self.value into a string with brackets equivalent to tuple format.
-            # Cannot convert straight to tuple as single element tuples contain a
-            # trailing comma which Python ICAT/JPQL doesn't accept
-            self.value = str(self.value).replace("[", "(").replace("]", ")")
-
-            # DataGateway Search can send requests with blank lists. Adding NULL to the
-            # filter prevents the API from returning a 500. An empty list will be
-            # returned instead, equivalent to the DB backend
-            if self.value == "()":
-                self.value = "(NULL)"
-
-            where_filter = self.create_condition(self.field, "in", self.value)
+            where_filter = self.create_condition(
+                self.field, "in", self.create_jpql_list(self.value), raw_value=True,
+            )
         elif self.operation == "nin":
-            # Convert self.value into a string with brackets equivalent to tuple format.
-            # Cannot convert straight to tuple as single element tuples contain a
-            # trailing comma which Python ICAT/JPQL doesn't accept
-            self.value = str(self.value).replace("[", "(").replace("]", ")")
-
-            # DataGateway Search can send requests with blank lists. Adding NULL to the
-            # filter prevents the API from returning a 500. An empty list will be
-            # returned instead, equivalent to the DB backend
-            if self.value == "()":
-                self.value = "(NULL)"
-
-            where_filter = self.create_condition(self.field, "not in", self.value)
+            where_filter = self.create_condition(
+                self.field, "not in", self.create_jpql_list(self.value), raw_value=True,
+            )
         elif self.operation == "between":
             where_filter = self.create_condition(
-                self.field, "between", f"'{self.value[0]}' and '{self.value[1]}'",
+                self.field,
+                "between",
+                f"'{self.escape_quotes(self.value[0])}' and"
+                f" '{self.escape_quotes(self.value[1])}'",
+                raw_value=True,
             )
         elif self.operation == "regexp":
             where_filter = self.create_condition(self.field, "regexp", self.value)
@@ -115,7 +131,7 @@ class PythonICATWhereFilter(WhereFilter):
         return where_filter
 
     @staticmethod
-    def create_condition(attribute_name, operator, value):
+    def create_condition(attribute_name, operator, value, raw_value=False):
         """
         Construct and return a Python dictionary containing conditions to be used in a
         Query object
@@ -125,26 +141,58 @@ class PythonICATWhereFilter(WhereFilter):
         :param operator: Operator to use when filtering the data
         :type operator: :class:`str`
         :param value: What ICAT will use to filter the data
-        :type value: :class:`str` or :class:`tuple` (when using an IN expression)
+        :type value: :class:`str`
+        :param raw_value: Flag to place `value` into the condition as it is (e.g. when
+            it's a list created by `create_jpql_list()`), rather than as a quoted
+            string literal with its quote marks escaped
+        :type raw_value: :class:`bool`
         :return: Condition (of type :class:`dict`) ready to be added to a Python ICAT
             Query object
         """
 
-        conditions = {}
-        # Removing quote marks when doing conditions with IN expressions or when a
-        # distinct filter is used in a request
         jpql_value = (
-            f"{value}"
-            if operator in ("in", "not in", "between")
-            or str(value).startswith("UPPER")
-            or "o." in str(value)
-            else f"'{value}'"
+            value if raw_value else f"'{PythonICATWhereFilter.escape_quotes(value)}'"
         )
 
-        conditions[attribute_name] = f"{operator} {jpql_value}"
+        conditions = {attribute_name: f"{operator} {jpql_value}"}
         log.debug("Conditions in ICAT where filter, %s", conditions)
         return conditions
 
+    @staticmethod
+    def escape_quotes(value):
+        """
+        Escape quote marks in a value that will be placed inside a JPQL string literal,
+        by doubling them
+
+        :param value: Value to be placed inside a string literal
+        :type value: Any type that can be converted to :class:`str`
+        :return: The value as a string with its quote marks escaped
+        """
+        return str(value).replace("'", "''")
+
+    @staticmethod
+    def create_jpql_list(values):
+        """
+        Create a list (in JPQL syntax) of the given values for use in IN expressions.
+        Numbers are left as they are, any other values are placed in quoted string
+        literals with their quote marks escaped
+
+        :param values: Values to create the list from
+        :type values: :class:`list`
+        :return: The JPQL list (of type :class:`str`) e.g. `(1, 2)` or `('a', 'b')`
+        """
+        jpql_values = ", ".join(
+            str(value)
+            if isinstance(value, (int, float)) and not isinstance(value, bool)
+            else f"'{PythonICATWhereFilter.escape_quotes(value)}'"
+            for value in values
+        )
+
+        # DataGateway Search can send requests with blank lists. Adding NULL to the
+        # filter prevents the API from returning a 500. An empty list will be returned
+        # instead, equivalent to the DB backend
+        return f"({jpql_values or 'NULL'})"
+
 
 class PythonICATDistinctFieldFilter(DistinctFieldFilter):
     def __init__(self, fields):
@@ -3,6 +3,7 @@ from functools import wraps
 import logging
 
 from cachetools import cached
+from cachetools.keys import hashkey
 from dateutil.tz import tzlocal
 from icat.entities import getTypeMap
 from icat.exception import (
@@ -10,10 +11,12 @@ from icat.exception import (
     ICATNoObjectError,
     ICATObjectExistsError,
     ICATParameterError,
+    ICATPrivilegesError,
     ICATSessionError,
     ICATValidationError,
 )
 
+from datagateway_api.src.common.config import Config
 from datagateway_api.src.common.date_handler import DateHandler
 from datagateway_api.src.common.exceptions import (
     AuthenticationError,
@@ -61,13 +64,18 @@ def requires_session_id(method):
             # Client object put into kwargs so it can be accessed by backend functions
             kwargs["client"] = client
 
-            # Find out if session has expired
-            session_time = client.getRemainingMinutes()
-            log.info("Session time: %d", session_time)
-            if session_time < 0:
-                raise AuthenticationError("Forbidden")
-            else:
-                return method(*args, **kwargs)
+            # Find out if session has expired. ICAT is only asked if the session's expiry
+            # time hasn't been cached on the client yet, or the cached time has passed.
+            # If the session ends early (e.g. logged out elsewhere), the backend
+            # operation will fail with an ICATSessionError instead
+            if client.session_expiry_passed():
+                session_time = client.getRemainingMinutes()
+                log.debug("Session time: %d", session_time)
+                if session_time < 0:
+                    raise AuthenticationError("Forbidden")
+                client.cache_session_expiry(session_time)
+
+            return method(*args, **kwargs)
         except ICATSessionError as e:
             raise AuthenticationError(e)
 
@@ -99,6 +107,7 @@ def get_cached_client(session_id, client_pool):
     log.info("Caching, session ID: %s", session_id)
     if session_id:
         client.sessionId = session_id
+    client.session_expiry = None
 
     return client
 
@@ -113,6 +122,9 @@ def get_session_details_helper(client):
         body
     """
     session_time_remaining = client.getRemainingMinutes()
+    # The remaining time has been fetched anyway, so the client's cached expiry time
+    # can be brought up to date
+    client.cache_session_expiry(session_time_remaining)
     session_expiry_time = (
         datetime.now(tzlocal()) + timedelta(minutes=session_time_remaining)
     ).replace(microsecond=0)
@@ -133,6 +145,7 @@ def logout_icat_client(client):
     :type client: :class:`icat.client.Client`
     """
     client.logout()
+    client.session_expiry = None
 
 
 def refresh_client_session(client):
@@ -143,6 +156,25 @@ def refresh_client_session(client):
     :type client: :class:`icat.client.Client`
     """
     client.refresh()
+    # The new expiry time will be fetched from ICAT on the client's next use
+    client.session_expiry = None
+
+
+@cached(cache={}, key=lambda client: hashkey(client.url))
+def get_icat_entity_name_map(client):
+    """
+    Build a dictionary which maps casefolded entity names to the camelCase versions used
+    by Python ICAT
+
+    The entity names only depend on the ICAT server the client is connected to, so the
+    mapping is cached using the client's URL. This prevents the type map being walked on
+    every request that needs to find an entity name.
+
+    :param client: ICAT client
+    :type client: :class:`icat.client.Client`
+    :return: Dictionary of casefolded entity names paired with their camelCase versions
+    """
+    return {entity_name.casefold(): entity_name for entity_name in getTypeMap(client)}
 
 
 def get_icat_entity_name_as_camel_case(client, entity_name):
@@ -161,14 +193,8 @@ def get_icat_entity_name_as_camel_case(client, entity_name):
     :raises BadRequestError: If the entity cannot be found
     """
 
-    entity_names = getTypeMap(client).keys()
-    lowercase_entity_name = entity_name.lower()
-    python_icat_entity_name = None
-
-    for entity_name in entity_names:
-        lowercase_name = entity_name.lower()
-        if lowercase_name == lowercase_entity_name:
-            python_icat_entity_name = entity_name
+    entity_name_map = get_icat_entity_name_map(client)
+    python_icat_entity_name = entity_name_map.get(entity_name.casefold())
 
     # Raise a 400 if a valid entity cannot be found
     if python_icat_entity_name is None:
@@ -193,18 +219,27 @@ def update_attributes(old_entity, new_entity):
         - typically if Python ICAT doesn't allow an attribute to be edited (e.g. modId &
         modTime)
     """
-    log.debug("Updating entity attributes: %s", list(new_entity.keys()))
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("Updating entity attributes: %s", list(new_entity.keys()))
+
+    # Checking membership of the entity's attribute and relation names avoids looking up
+    # (and catching errors from) attributes which don't exist on the entity
+    entity_fields = (
+        old_entity.InstAttr
+        | old_entity.MetaAttr
+        | old_entity.InstRel
+        | old_entity.InstMRel
+    )
     for key in new_entity:
-        try:
-            original_data_attribute = getattr(old_entity, key)
-            if isinstance(original_data_attribute, datetime):
-                new_entity[key] = DateHandler.str_to_datetime_object(new_entity[key])
-        except AttributeError:
+        if key not in entity_fields:
             raise BadRequestError(
                 f"Bad request made, cannot find attribute '{key}' within the"
                 f" {old_entity.BeanName} entity",
             )
 
+        if isinstance(getattr(old_entity, key), datetime):
+            new_entity[key] = DateHandler.str_to_datetime_object(new_entity[key])
+
         try:
             setattr(old_entity, key, new_entity[key])
         except AttributeError:
@@ -257,20 +292,115 @@ def get_entity_by_id(
     log.info("Getting %s of the ID %s", entity_type, id_)
     log.debug("Return related entities set to: %s", return_related_entities)
 
-    # Set query condition for the selected ID
-    id_condition = PythonICATWhereFilter.create_condition("id", "=", id_)
+    # Fetching by primary key means ICAT doesn't need to parse and run a search query
+    includes_value = " INCLUDE 1" if return_related_entities else ""
+    try:
+        entity = client.get(f"{entity_type}{includes_value}", id_)
+    except (ICATNoObjectError, ICATPrivilegesError):
+        # Records the user cannot read are treated as missing, as they are when a
+        # search query returns no results
+        raise MissingRecordError("No result found")
+
+    if return_json_formattable_data:
+        query = ICATQuery(client, entity_type)
+        include_tree = (
+            query.build_include_tree(entity.InstRel) if return_related_entities else {}
+        )
+        return query.entity_to_dict(entity, include_tree)
+    else:
+        return entity
+
+
+def get_entities_by_ids(
+    client,
+    entity_type,
+    ids,
+    return_json_formattable_data,
+    return_related_entities=False,
+):
+    """
+    Gets the records of the given IDs from the specified entity, using a single query
+
+    IDs which cannot be found in ICAT are absent from the returned dictionary, so the
+    caller should check for any that are missing.
+
+    :param client: ICAT client containing an authenticated user
+    :type client: :class:`icat.client.Client`
+    :param entity_type: The type of entity requested to manipulate data with
+    :type entity_type: :class:`str`
+    :param ids: ID numbers of the entities to retrieve
+    :type ids: :class:`list`
+    :param return_json_formattable_data: Flag to determine whether the data should be
+        returned as data ready to be converted straight to JSON (i.e. if the data will
+        be used as a response for an API call) or whether to leave the data in a Python
+        ICAT format
+    :type return_json_formattable_data: :class:`bool`
+    :param return_related_entities: Flag to determine whether related entities should
+        automatically be returned or not
+    :type return_related_entities: :class:`bool`
+    :return: Dictionary of the records found, keyed by their ID
+    """
+    log.info("Getting %s of the IDs %s", entity_type, ids)
+    log.debug("Return related entities set to: %s", return_related_entities)
+
+    # Set query condition for the selected IDs
+    ids_condition = PythonICATWhereFilter.create_condition(
+        "id", "in", PythonICATWhereFilter.create_jpql_list(ids), raw_value=True,
+    )
 
     includes_value = "1" if return_related_entities else None
-    id_query = ICATQuery(
-        client, entity_type, conditions=id_condition, includes=includes_value,
+    ids_query = ICATQuery(
+        client, entity_type, conditions=ids_condition, includes=includes_value,
+    )
+    entities_by_ids_data = ids_query.execute_query(
+        client, return_json_formattable_data,
     )
-    entity_by_id_data = id_query.execute_query(client, return_json_formattable_data)
 
-    if not entity_by_id_data:
-        # Cannot find any data matching the given ID
-        raise MissingRecordError("No result found")
+    if return_json_formattable_data:
+        return {entity["id"]: entity for entity in entities_by_ids_data}
     else:
-        return entity_by_id_data[0]
+        return {entity.id: entity for entity in entities_by_ids_data}
+
+
+def get_entities_in_id_order(
+    client,
+    entity_type,
+    ids,
+    return_json_formattable_data,
+    return_related_entities=False,
+):
+    """
+    Gets the records of the given IDs from the specified entity using a single query,
+    returning them in the same order as `ids`
+
+    :param client: ICAT client containing an authenticated user
+    :type client: :class:`icat.client.Client`
+    :param entity_type: The type of entity requested to manipulate data with
+    :type entity_type: :class:`str`
+    :param ids: ID numbers of the entities to retrieve
+    :type ids: :class:`list`
+    :param return_json_formattable_data: Flag to determine whether the data should be
+        returned as data ready to be converted straight to JSON or whether to leave the
+        data in a Python ICAT format
+    :type return_json_formattable_data: :class:`bool`
+    :param return_related_entities: Flag to determine whether related entities should
+        automatically be returned or not
+    :type return_related_entities: :class:`bool`
+    :return: List of the records of the given IDs
+    :raises MissingRecordError: If a record of any of the IDs cannot be found
+    """
+    entities_by_id = get_entities_by_ids(
+        client,
+        entity_type,
+        ids,
+        return_json_formattable_data,
+        return_related_entities=return_related_entities,
+    )
+
+    try:
+        return [entities_by_id[id_] for id_ in ids]
+    except KeyError:
+        raise MissingRecordError("No result found")
 
 
 def delete_entity_by_id(client, entity_type, id_):
@@ -285,8 +415,15 @@ def delete_entity_by_id(client, entity_type, id_):
     :type id_: :class:`int`
     """
     log.info("Deleting %s of ID %s", entity_type, id_)
-    entity_id_data = get_entity_by_id(client, entity_type, id_, False)
-    client.delete(entity_id_data)
+    # ICAT only needs the entity type and ID to delete a record, so the record doesn't
+    # need to be fetched from ICAT beforehand
+    entity = client.new(get_icat_entity_name_as_camel_case(client, entity_type), id=id_)
+    try:
+        client.delete(entity)
+    except (ICATNoObjectError, ICATPrivilegesError):
+        # As per `get_entity_by_id()`, records the user cannot read are treated as
+        # missing so a 404 is returned without revealing whether the record exists
+        raise MissingRecordError("No result found")
 
 
 def update_entity_by_id(client, entity_type, id_, new_data):
@@ -314,9 +451,15 @@ def update_entity_by_id(client, entity_type, id_, new_data):
     updated_icat_entity = update_attributes(entity_id_data, new_data)
     push_data_updates_to_icat(updated_icat_entity)
 
-    # The record is re-obtained from Python ICAT (rather than using entity_id_data) to
-    # show to the user whether the change has actually been applied
-    return get_entity_by_id(client, entity_type, id_, True)
+    if Config.config.datagateway_api.refetch_updated_entities:
+        # The record is re-obtained from Python ICAT (rather than using entity_id_data)
+        # to show to the user whether the change has actually been applied
+        return get_entity_by_id(client, entity_type, id_, True)
+
+    # Any failure to update the record would've raised an exception, so the updated
+    # entity can be converted locally. Meta attributes (e.g. modTime) will show their
+    # values from before this update
+    return ICATQuery(client, entity_type).entity_to_dict(updated_icat_entity, {})
 
 
 def get_entity_with_filters(client, entity_type, filters):
@@ -428,32 +571,24 @@ def update_entities(client, entity_type, data_to_update):
     """
     log.info("Updating certain results in %s", entity_type)
 
-    updated_data = []
-
     if not isinstance(data_to_update, list):
         data_to_update = [data_to_update]
 
     icat_data_backup = []
     updated_icat_data = []
 
-    for entity_request in data_to_update:
-        try:
-            entity_data = get_entity_by_id(
-                client,
-                entity_type,
-                entity_request["id"],
-                False,
-                return_related_entities=True,
-            )
-            icat_data_backup.append(entity_data.copy())
+    request_ids = get_ids_from_update_request(data_to_update)
 
-            updated_entity_data = update_attributes(entity_data, entity_request)
-            updated_icat_data.append(updated_entity_data)
-        except KeyError:
-            raise BadRequestError(
-                "The new data in the request body must contain the ID (using the key:"
-                " 'id') of the entity you wish to update",
-            )
+    # Every entity that will be updated is fetched from ICAT in a single query
+    entities_data = get_entities_in_id_order(
+        client, entity_type, request_ids, False, return_related_entities=True,
+    )
+
+    for entity_data, entity_request in zip(entities_data, data_to_update):
+        icat_data_backup.append(entity_data.copy())
+
+        updated_entity_data = update_attributes(entity_data, entity_request)
+        updated_icat_data.append(updated_entity_data)
 
     # This separates the local data updates from pushing these updates to icatdb
     for updated_icat_entity in updated_icat_data:
@@ -472,13 +607,56 @@ def update_entities(client, entity_type, data_to_update):
 
             raise PythonICATError(e)
 
-        updated_data.append(
-            get_entity_by_id(client, entity_type, updated_icat_entity.id, True),
-        )
+    if Config.config.datagateway_api.refetch_updated_entities:
+        return get_entities_in_id_order(client, entity_type, request_ids, True)
+
+    # As per `update_entity_by_id()`, the updated entities can be converted locally
+    # rather than being re-obtained from ICAT
+    query = ICATQuery(client, entity_type)
+    updated_data = [query.entity_to_dict(entity, {}) for entity in updated_icat_data]
 
     return updated_data
 
 
+def get_ids_from_update_request(data_to_update):
+    """
+    Get the IDs of the entities to update from the data of an update request, checking
+    each is an integer and only given once
+
+    :param data_to_update: The data that to be updated in ICAT
+    :type data_to_update: :class:`list`
+    :return: List of the IDs, in the same order as `data_to_update`
+    :raises BadRequestError: If an ID is missing, isn't an integer or is duplicated
+    """
+    request_ids = []
+    for entity_request in data_to_update:
+        try:
+            id_ = entity_request["id"]
+        except KeyError:
+            raise BadRequestError(
+                "The new data in the request body must contain the ID (using the key:"
+                " 'id') of the entity you wish to update",
+            )
+
+        # IDs given as strings of digits are accepted, but other types (e.g. floats)
+        # aren't converted so an ID such as 1.9 isn't treated as 1
+        if isinstance(id_, str) and id_.isdigit():
+            id_ = int(id_)
+        if type(id_) is not int:
+            raise BadRequestError(
+                "The ID of each entity in the request body must be an integer",
+            )
+        # Each ID maps to a single entity object, so updating the same entity twice
+        # would make the backup of the second update contain the first update
+        if id_ in request_ids:
+            raise BadRequestError(
+                f"The ID {id_} is given more than once in the request body",
+            )
+        request_ids.append(id_)
+
+    return request_ids
+
+
 def create_entities(client, entity_type, data):
     """
     Add one or more results for the given entity using the JSON provided in `data`
@@ -500,7 +678,7 @@ def create_entities(client, entity_type, data):
     """
     log.info("Creating ICAT data for %s", entity_type)
 
-    created_data = []
+    created_ids = []
     created_icat_data = []
 
     if not isinstance(data, list):
@@ -539,20 +717,20 @@ def create_entities(client, entity_type, data):
         try:
             entity.create()
         except ICATInternalError as e:
-            for entity_json in created_data:
+            for created_id in created_ids:
                 # Delete any data that has been pushed to ICAT before the exception
-                delete_entity_by_id(client, entity_type, entity_json["id"])
+                delete_entity_by_id(client, entity_type, created_id)
 
             raise PythonICATError(e)
         except (ICATObjectExistsError, ICATParameterError, ICATValidationError) as e:
-            for entity_json in created_data:
-                delete_entity_by_id(client, entity_type, entity_json["id"])
+            for created_id in created_ids:
+                delete_entity_by_id(client, entity_type, created_id)
 
             raise BadRequestError(e)
 
-        created_data.append(get_entity_by_id(client, entity_type, entity.id, True))
+        created_ids.append(entity.id)
 
-    return created_data
+    return get_entities_in_id_order(client, entity_type, created_ids, True)
 
 
 def get_facility_cycles_for_instrument(
@@ -588,10 +766,10 @@ def get_facility_cycles_for_instrument(
         "eq",
     )
     investigation_start_date_check = PythonICATWhereFilter(
-        "facility.investigations.startDate", "o.startDate", "gte",
+        "facility.investigations.startDate", "o.startDate", "gte", raw_value=True,
     )
     investigation_end_date_check = PythonICATWhereFilter(
-        "facility.investigations.startDate", "o.endDate", "lte",
+        "facility.investigations.startDate", "o.endDate", "lte", raw_value=True,
     )
 
     facility_cycle_filters = [
@@ -670,10 +848,10 @@ def get_investigations_for_instrument_in_facility_cycle(
         "facility.facilityCycles.id", facilitycycle_id, "eq",
     )
     facility_cycle_start_date_check = PythonICATWhereFilter(
-        "facility.facilityCycles.startDate", "o.startDate", "lte",
+        "facility.facilityCycles.startDate", "o.startDate", "lte", raw_value=True,
     )
     facility_cycle_end_date_check = PythonICATWhereFilter(
-        "facility.facilityCycles.endDate", "o.startDate", "gte",
+        "facility.facilityCycles.endDate", "o.startDate", "gte", raw_value=True,
     )
 
     required_filters = [
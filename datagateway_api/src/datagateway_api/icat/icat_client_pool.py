@@ -1,3 +1,4 @@
+from datetime import datetime, timedelta
 import logging
 
 from icat.client import Client
@@ -7,6 +8,10 @@ from datagateway_api.src.common.config import Config
 
 log = logging.getLogger()
 
+# Cached session expiry times are treated as passed slightly early, so a session isn't
+# used right up until the point it expires
+SESSION_EXPIRY_MARGIN = timedelta(seconds=30)
+
 
 class ICATClient(Client):
     """Wrapper class to allow an object pool of client objects to be created"""
@@ -23,6 +28,32 @@ class ICATClient(Client):
         super().__init__(icat_url, checkCert=icat_check_cert)
         # When clients are cleaned up, sessions won't be logged out
         self.autoLogout = False
+        # Expiry time of the client's session, cached so ICAT doesn't need to be asked
+        # whether the session has expired on every request
+        self.session_expiry = None
+
+    def session_expiry_passed(self):
+        """
+        Check whether the expiry time cached for the client's session has passed (or is
+        within `SESSION_EXPIRY_MARGIN` of passing). If no expiry time is cached, it's
+        treated as passed so the remaining session time is fetched from ICAT
+
+        :return: Boolean to signify whether ICAT should be asked about the session
+        """
+        return (
+            self.session_expiry is None
+            or self.session_expiry - SESSION_EXPIRY_MARGIN <= datetime.now()
+        )
+
+    def cache_session_expiry(self, remaining_minutes):
+        """
+        Cache the expiry time of the client's session
+
+        :param remaining_minutes: Time remaining in the session, as returned by
+            `getRemainingMinutes()`
+        :type remaining_minutes: :class:`float`
+        """
+        self.session_expiry = datetime.now() + timedelta(minutes=remaining_minutes)
 
     def clean_up(self):
         """
@@ -28,6 +28,7 @@ class ExtendedLRUCache(LRUCache):
 
         # Flushing session ID so next time the client object is used, there's no issues
         client.sessionId = None
+        client.session_expiry = None
 
         # Put client back into pool - resource stats aren't used in the API, so defaults
         # are passed in
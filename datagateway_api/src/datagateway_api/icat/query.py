@@ -1,4 +1,3 @@
-from datetime import datetime
 import logging
 
 from icat.entity import Entity, EntityList
@@ -14,6 +13,11 @@ log = logging.getLogger()
 
 
 class ICATQuery:
+    # Attribute, date attribute and relation names of each entity class converted by
+    # `entity_to_dict()`. These only depend on the class, so they're shared between
+    # instances to only be looked up once per class
+    entity_class_fields = {}
+
     def __init__(
         self, client, entity_name, conditions=None, aggregate=None, includes=None,
     ):
@@ -40,7 +44,6 @@ class ICATQuery:
         # Needed for ISIS endpoints as they use DISTINCT keyword but don't select
         # multiple attributes
         self.isis_endpoint = False
-
         try:
             log.info("Creating ICATQuery for entity: %s", entity_name)
             self.query = Query(
@@ -75,13 +78,31 @@ class ICATQuery:
         :raises PythonICATError: If an error occurs during query execution
         """
 
-        try:
-            log.debug("Executing ICAT query: %s", self.query)
-            query_result = client.search(self.query)
-        except (ICATValidationError, ICATInternalError) as e:
-            raise PythonICATError(e)
+        if return_json_formattable:
+            return list(self.execute_query_iter(client))
+        else:
+            log.info("Query results will be returned as ICAT entities")
+            return self.search(client)
+
+    def execute_query_iter(self, client):
+        """
+        Execute the ICAT Query object and yield each result in a format ready to be
+        converted to JSON
+
+        Results are converted one at a time, so callers which process each result
+        further (e.g. the search API) don't need to hold a list of every converted
+        result at once
+
+        :param client: ICAT client containing an authenticated user
+        :type client: :class:`icat.client.Client`
+        :return: Generator of data from the executed query, each element ready to be
+            converted straight to JSON
+        :raises PythonICATError: If an error occurs during query execution
+        """
 
-        flat_query_includes = self.flatten_query_included_fields(self.query.includes)
+        query_result = self.search(client)
+
+        include_tree = self.build_include_tree(self.query.includes)
 
         # If the query has a COUNT function applied to it, some of these steps can be
         # skipped
@@ -103,111 +124,159 @@ class ICATQuery:
             # Check query's conditions for the ones created by the distinct filter
             distinct_attributes = self.get_distinct_attributes()
 
-        if return_json_formattable:
-            log.info("Query results will be returned in a JSON format")
-            data = []
-
-            if self.query.manual_count:
-                # Manually count the number of results
-                data.append(len(query_result))
-                return data
-
-            for result in query_result:
-                if distinct_query:
-                    # When multiple attributes are given in a distinct filter, Python
-                    # ICAT returns the results in a nested list. This doesn't happen
-                    # when a single attribute is given, so the result is encased in a
-                    # list as `map_distinct_attributes_to_results()` assumes a list as
-                    # input
-                    if not isinstance(result, tuple):
-                        result = [result]
-
-                    # Map distinct attributes and result
-                    data.append(
-                        map_distinct_attributes_to_results(distinct_attributes, result),
-                    )
-                elif not count_query:
-                    dict_result = self.entity_to_dict(result, flat_query_includes)
-                    data.append(dict_result)
-                else:
-                    data.append(result)
-
-            return data
-        else:
-            log.info("Query results will be returned as ICAT entities")
-            return query_result
+        log.info("Query results will be returned in a JSON format")
+
+        if self.query.manual_count:
+            # Manually count the number of results
+            yield len(query_result)
+            return
+
+        for result in query_result:
+            if distinct_query:
+                # When multiple attributes are given in a distinct filter, Python ICAT
+                # returns the results in a nested list. This doesn't happen when a
+                # single attribute is given, so the result is encased in a list as
+                # `map_distinct_attributes_to_results()` assumes a list as input
+                if not isinstance(result, tuple):
+                    result = [result]
+
+                # Map distinct attributes and result
+                yield map_distinct_attributes_to_results(distinct_attributes, result)
+            elif not count_query:
+                yield self.entity_to_dict(result, include_tree)
+            else:
+                yield result
+
+    def search(self, client):
+        """
+        Send the ICAT Query object to ICAT and return the results as Python ICAT
+        entities
+
+        :param client: ICAT client containing an authenticated user
+        :type client: :class:`icat.client.Client`
+        :return: Data (of type list) from the executed query
+        :raises PythonICATError: If an error occurs during query execution
+        """
+
+        try:
+            log.debug("Executing ICAT query: %s", self.query)
+            return client.search(self.query)
+        except (ICATValidationError, ICATInternalError) as e:
+            raise PythonICATError(e)
 
     def get_distinct_attributes(self):
         return self.query.attributes
 
-    def entity_to_dict(self, entity, includes):
+    def entity_to_dict(self, entity, include_tree):
         """
         This expands on Python ICAT's implementation of `icat.entity.Entity.as_dict()`
         to use set operators to create a version of the entity as a dictionary
 
-        Most of this function is dedicated to recursing over included fields from a
-        query, since this is functionality isn't part of Python ICAT's `as_dict()`. This
+        Most of this function is dedicated to walking over included fields from a query,
+        since this is functionality isn't part of Python ICAT's `as_dict()`. This
         function can be used when there are no include filters in the query/request
-        however.
+        however. Related entities are processed using a stack, rather than recursion, so
+        each related entity only needs its part of the include tree.
 
         :param entity: Python ICAT entity from an ICAT query
         :type entity: :class:`icat.entities.ENTITY` (implementation of
             :class:`icat.entity.Entity`) or :class:`icat.entity.EntityList`
-        :param includes: List of fields that have been included in the ICAT query. It is
-            assumed each element has been checked for multiple fields separated by dots,
-            split them accordingly and flattened the resulting list. Note:
-            ICATQuery.flatten_query_included_fields performs this functionality.
-        :type includes: :class:`list`
+        :param include_tree: Nested dictionary of fields that have been included in the
+            ICAT query. Note: ICATQuery.build_include_tree creates this from the query's
+            included fields
+        :type include_tree: :class:`dict`
         :return: ICAT Data (of type dictionary) ready to be serialised to JSON
         """
 
-        d = {}
+        entity_dict = {}
+        # Each element contains an entity, the include tree relevant to that entity and
+        # the dictionary that the entity's data should be added to
+        stack = [(entity, include_tree, entity_dict)]
+
+        while stack:
+            entity, include_tree, d = stack.pop()
 
-        # Verifying that `includes` only has fields which are related to the entity
-        include_set = (entity.InstRel | entity.InstMRel) & set(includes)
-        for key in entity.InstAttr | entity.MetaAttr | include_set:
-            if key in includes:
+            attributes, date_attributes, relations = self.get_entity_class_fields(
+                entity,
+            )
+
+            # Add actual pieces of data to the dictionary
+            for key in attributes:
+                d[key] = getattr(entity, key)
 
+            # Convert datetime objects to strings ready to be outputted as JSON
+            for key in date_attributes:
+                if d[key] is not None:
+                    d[key] = DateHandler.datetime_object_to_str(d[key])
+
+            # Verifying that `include_tree` only has fields which are related to the
+            # entity
+            for key in include_tree.keys() & relations:
                 target = getattr(entity, key)
-                # Copy and remove don't return values so must be done separately
-                includes_copy = includes.copy()
-                try:
-                    includes_copy.remove(key)
-                except ValueError:
-                    log.warning(
-                        "Key couldn't be found to remove from include list, this could"
-                        " cause an issue further on in the request",
-                    )
                 if isinstance(target, Entity):
-                    d[key] = self.entity_to_dict(target, includes_copy)
+                    d[key] = {}
+                    stack.append((target, include_tree[key], d[key]))
                 # Related fields with one-many relationships are stored as EntityLists
                 elif isinstance(target, EntityList):
                     d[key] = []
-                    for e in target:
-                        d[key].append(self.entity_to_dict(e, includes_copy))
+                    for related_entity in target:
+                        related_dict = {}
+                        d[key].append(related_dict)
+                        stack.append((related_entity, include_tree[key], related_dict))
 
-            # Add actual piece of data to the dictionary
-            else:
-                entity_data = getattr(entity, key)
-                # Convert datetime objects to strings ready to be outputted as JSON
-                if isinstance(entity_data, datetime):
-                    # Remove timezone data which isn't utilised in ICAT
-                    entity_data = DateHandler.datetime_object_to_str(entity_data)
+        return entity_dict
 
-                d[key] = entity_data
-        return d
+    def get_entity_class_fields(self, entity):
+        """
+        Get the names of the attributes, date attributes and relations of an entity's
+        class. These are stored on the class so they're only worked out once per entity
+        class, rather than for every entity converted by `entity_to_dict()`
+
+        Date attributes are found using the entity info of the class. Python ICAT caches
+        entity info on the client, so this doesn't make any calls to ICAT.
 
-    def flatten_query_included_fields(self, includes):
+        :param entity: Python ICAT entity to get the attribute and relation names of
+        :type entity: :class:`icat.entities.ENTITY` (implementation of
+            :class:`icat.entity.Entity`)
+        :return: Tuple containing frozensets of the attribute names (including meta
+            attributes), the names of attributes which contain dates and the relation
+            names
+        """
+        entity_class = type(entity)
+        try:
+            return ICATQuery.entity_class_fields[entity_class]
+        except KeyError:
+            attributes = entity.InstAttr | entity.MetaAttr
+            date_attributes = frozenset(
+                attribute
+                for attribute in attributes
+                if entity.getAttrInfo(entity.client, attribute).type == "Date"
+            )
+            fields = (attributes, date_attributes, entity.InstRel | entity.InstMRel)
+            ICATQuery.entity_class_fields[entity_class] = fields
+            return fields
+
+    def build_include_tree(self, includes):
         """
         This will take the set of fields included in an ICAT query, split up the fields
-        separated by dots, and flatten the resulting list
+        separated by dots, and arrange them into a nested dictionary. This means the
+        included fields are only split once per query, rather than for each result
+
+        For example, {"investigation.instrument", "datasetType"} becomes
+        {"investigation": {"instrument": {}}, "datasetType": {}}
 
         :param includes: Set of fields that have been included in the ICAT query. Where
             fields have a chain of relationships, they're a single element string
             separated by dots
         :type includes: :class:`set`
-        :return: Flattened list containing all the fields that have been included in the
-            ICAT query
+        :return: Nested dictionary containing all the fields that have been included in
+            the ICAT query
         """
 
-        return [m for n in (field.split(".") for field in sorted(includes)) for m in n]
+        include_tree = {}
+        for field in includes:
+            subtree = include_tree
+            for field_name in field.split("."):
+                subtree = subtree.setdefault(field_name, {})
+
+        return include_tree
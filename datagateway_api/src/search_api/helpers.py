@@ -1,7 +1,7 @@
 from functools import wraps
-import json
 import logging
 
+from icat.exception import ICATSessionError
 from pydantic import ValidationError
 
 from datagateway_api.src.common.exceptions import (
@@ -24,6 +24,12 @@ from datagateway_api.src.search_api.session_handler import (
 
 log = logging.getLogger()
 
+# PaNOSC model classes, keyed by entity name so the model for a request can be found
+# using a dictionary lookup
+PANOSC_MODELS = {
+    model.__name__: model for model in models.PaNOSCAttribute.__subclasses__()
+}
+
 
 def search_api_error_handling(method):
     """
@@ -31,6 +37,11 @@ def search_api_error_handling(method):
     required for the search API. The decorator should be applied to search API endpoint
     resources
 
+    If the client's session ends before its cached expiry time, `client_manager` logs
+    the client in again and the endpoint method is retried once. The filters are
+    created again from the request by the retry, as filters which have already been
+    applied to a query cannot be reused
+
     :param method: The method for the endpoint
     :raises: Any exception caught by the execution of `method`
     """
@@ -38,7 +49,15 @@ def search_api_error_handling(method):
     @wraps(method)
     def wrapper_error_handling(*args, **kwargs):
         try:
-            return method(*args, **kwargs)
+            try:
+                return method(*args, **kwargs)
+            except ICATSessionError as e:
+                log.debug("Retrying request after client session ended: %s", e.args)
+                return method(*args, **kwargs)
+        except ICATSessionError as e:
+            log.exception(msg=e.args)
+            assign_status_code(e, 500)
+            raise SearchAPIError(create_error_message(e))
         except ValidationError as e:
             log.exception(msg=e.args)
             assign_status_code(e, 500)
@@ -74,6 +93,32 @@ def search_api_error_handling(method):
     return wrapper_error_handling
 
 
+def _apply_filters(query, filters, panosc_entity_name=None):
+    """
+    Add the given filters to a filter handler and apply them to the query
+
+    :param query: The query to apply the filters to
+    :type query: :class:`SearchAPIQuery`
+    :param filters: The list of Search API filters to be applied to the query
+    :type filters: List of specific implementation :class:`QueryFilter`
+    :param panosc_entity_name: If given, the ICAT relations needed to populate the
+        PaNOSC entity's fields (and those of its included entities) are also added
+    :type panosc_entity_name: :class:`str`
+    """
+
+    filter_handler = FilterOrderHandler()
+    filter_handler.add_filters(filters)
+    if panosc_entity_name:
+        filter_handler.add_icat_relations_for_panosc_non_related_fields(
+            panosc_entity_name,
+        )
+        filter_handler.add_icat_relations_for_non_related_fields_of_panosc_related_entities(  # noqa: B950
+            panosc_entity_name,
+        )
+    filter_handler.merge_python_icat_limit_skip_filters()
+    filter_handler.apply_filters(query)
+
+
 @client_manager
 def get_search(entity_name, filters):
     """
@@ -88,9 +133,23 @@ def get_search(entity_name, filters):
         query constructed from that and the request's filters
     """
 
+    return _get_search(entity_name, filters)
+
+
+def _get_search(entity_name, filters):
+    """
+    Implementation of `get_search()` without the `client_manager` decorator, so it can
+    be used by functions which have already been decorated with it
+    """
+
     log.info("Searching for %s using request's filters", entity_name)
     log.debug("Entity Name: %s, Filters: %s", entity_name, filters)
 
+    try:
+        panosc_model = PANOSC_MODELS[entity_name]
+    except KeyError:
+        raise BadRequestError(f"Cannot find PaNOSC model for entity: {entity_name}")
+
     entity_relations = []
     for filter_ in filters:
         if isinstance(filter_, SearchAPIIncludeFilter):
@@ -98,25 +157,17 @@ def get_search(entity_name, filters):
 
     query = SearchAPIQuery(entity_name)
 
-    filter_handler = FilterOrderHandler()
-    filter_handler.add_filters(filters)
-    filter_handler.add_icat_relations_for_panosc_non_related_fields(entity_name)
-    filter_handler.add_icat_relations_for_non_related_fields_of_panosc_related_entities(
-        entity_name,
-    )
-    filter_handler.merge_python_icat_limit_skip_filters()
-    filter_handler.apply_filters(query)
+    _apply_filters(query, filters, panosc_entity_name=entity_name)
 
     log.debug("JPQL Query to be sent/executed in ICAT: %s", query.icat_query.query)
-    icat_query_data = query.icat_query.execute_query(SessionHandler.client, True)
-
-    panosc_data = []
-    for icat_data in icat_query_data:
-        panosc_model = getattr(models, entity_name)
-        panosc_record = panosc_model.from_icat(icat_data, entity_relations).json(
-            by_alias=True,
-        )
-        panosc_data.append(json.loads(panosc_record))
+    # Each result is converted into a PaNOSC record as it's produced, so the ICAT data of
+    # every result isn't held in a list at the same time as the PaNOSC records. Search
+    # API datetimes are converted to strings when the model is validated, so the
+    # dictionaries are ready to be converted to JSON
+    panosc_data = [
+        panosc_model.from_icat(icat_data, entity_relations).dict(by_alias=True)
+        for icat_data in query.icat_query.execute_query_iter(SessionHandler.client)
+    ]
 
     return panosc_data
 
@@ -145,7 +196,7 @@ def get_with_pid(entity_name, pid, filters):
 
     filters.append(SearchAPIWhereFilter("pid", pid, "eq"))
 
-    panosc_data = get_search(entity_name, filters)
+    panosc_data = _get_search(entity_name, filters)
     if not panosc_data:
         raise MissingRecordError("No result found")
     else:
@@ -165,17 +216,21 @@ def get_count(entity_name, filters):
     :return: Dict containing the number of records returned from the query
     """
 
+    return _get_count(entity_name, filters)
+
+
+def _get_count(entity_name, filters):
+    """
+    Implementation of `get_count()` without the `client_manager` decorator, so it can
+    be used by functions which have already been decorated with it
+    """
+
     log.info("Getting number of results for %s, using request's filters", entity_name)
     log.debug("Entity Name: %s, Filters: %s", entity_name, filters)
 
     query = SearchAPIQuery(entity_name, aggregate="COUNT")
 
-    filter_handler = FilterOrderHandler()
-    filter_handler.add_filters(filters)
-    filter_handler.merge_python_icat_limit_skip_filters()
-    filter_handler.apply_filters(query)
-
-    log.debug("Python ICAT Query: %s", query.icat_query.query)
+    _apply_filters(query, filters)
 
     log.debug("JPQL Query to be sent/executed in ICAT: %s", query.icat_query.query)
     icat_query_data = query.icat_query.execute_query(SessionHandler.client, True)
@@ -203,7 +258,7 @@ def get_files(entity_name, pid, filters):
     )
 
     filters.append(SearchAPIWhereFilter("dataset.pid", pid, "eq"))
-    return get_search(entity_name, filters)
+    return _get_search(entity_name, filters)
 
 
 @client_manager
@@ -228,4 +283,4 @@ def get_files_count(entity_name, filters, pid):
     )
 
     filters.append(SearchAPIWhereFilter("dataset.pid", pid, "eq"))
-    return get_count(entity_name, filters)
+    return _get_count(entity_name, filters)
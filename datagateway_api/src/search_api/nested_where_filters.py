@@ -1,6 +1,6 @@
 import logging
 
-from datagateway_api.src.common.filters import WhereFilter
+from datagateway_api.src.common.filters import FilterKind, WhereFilter
 from datagateway_api.src.search_api.filters import SearchAPIWhereFilter
 
 log = logging.getLogger()
@@ -8,6 +8,7 @@ log = logging.getLogger()
 
 class NestedWhereFilters:
     precedence = WhereFilter.precedence
+    kind = FilterKind.WHERE
 
     def __init__(self, lhs, rhs, joining_operator, search_api_query=None):
         """
@@ -59,9 +60,9 @@ class NestedWhereFilters:
         """
 
         log.debug(
-            "Setting SearchAPIQuery for NestedWhereFilters. Query filter: %s, Search"
+            "Setting SearchAPIQuery for NestedWhereFilters. Query filter: %r, Search"
             " API query: %s",
-            repr(query_filter),
+            query_filter,
             search_api_query,
         )
 
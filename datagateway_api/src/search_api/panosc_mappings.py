@@ -14,6 +14,10 @@ class PaNOSCMappings:
         self, path=Path(__file__).parent.parent.parent / "search_api_mapping.json",
     ):
         """Load contents of `search_api_mapping.json` into this class"""
+        # Unique ICAT relations for the non-related fields of each PaNOSC entity. These
+        # only depend on the mappings, so are only worked out once per entity
+        self.unique_icat_relations = {}
+
         try:
             with open(path, encoding="utf-8") as target:
                 log.info("Loading PaNOSC to ICAT mappings from %s", path)
@@ -157,6 +161,32 @@ class PaNOSCMappings:
 
         return icat_relations
 
+    def get_unique_icat_relations_for_panosc_non_related_fields(
+        self, panosc_entity_name,
+    ):
+        """
+        This function retrieves the ICAT relations for the non related fields of a
+        given PaNOSC entity, with any duplicate relations removed. The result is cached
+        per entity, as it only depends on the contents of the mappings
+
+        :param panosc_entity_name: A PaNOSC entity name e.g. "Dataset"
+        :type panosc_entity_name: :class:`str`
+        :return: Tuple containing the unique ICAT relations for the non related fields
+            of the given PaNOSC entity
+        """
+        try:
+            return self.unique_icat_relations[panosc_entity_name]
+        except KeyError:
+            icat_relations = tuple(
+                dict.fromkeys(
+                    self.get_icat_relations_for_panosc_non_related_fields(
+                        panosc_entity_name,
+                    ),
+                ),
+            )
+            self.unique_icat_relations[panosc_entity_name] = icat_relations
+            return icat_relations
+
     def get_icat_relations_for_non_related_fields_of_panosc_relation(
         self, panosc_entity_name, entity_relation,
     ):
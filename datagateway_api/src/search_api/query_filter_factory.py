@@ -111,12 +111,10 @@ class SearchAPIQueryFilterFactory(QueryFilterFactory):
         """
 
         where_filters = []
-        if (
-            list(where_filter_input.keys())[0] == "and"
-            or list(where_filter_input.keys())[0] == "or"
-        ):
-            log.debug("and/or operators found: %s", list(where_filter_input.keys())[0])
-            boolean_operator = list(where_filter_input.keys())[0]
+        first_key = next(iter(where_filter_input))
+        if first_key == "and" or first_key == "or":
+            log.debug("and/or operators found: %s", first_key)
+            boolean_operator = first_key
             conditions = list(where_filter_input.values())[0]
             conditional_where_filters = []
 
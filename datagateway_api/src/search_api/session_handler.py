@@ -24,17 +24,43 @@ def client_manager(method):
     decorator checks if the client has a valid session, and if not, logs in as the anon
     user
 
+    ICAT is only asked about the session once the expiry time cached on the client has
+    passed. If the session ends before then (e.g. ICAT has been restarted), the client
+    logs in again and the session error is raised. The request isn't retried here
+    because the filters given to `method` have already been applied (and modified) by
+    the time the session error is raised, so it's retried by
+    `search_api_error_handling`, where the filters are created again
+
     :param method: The function used to process an incoming request
     """
 
     @wraps(method)
     def wrapper_client_manager(*args, **kwargs):
+        client = SessionHandler.client
+        if client.session_expiry_passed():
+            try:
+                client.cache_session_expiry(client.getRemainingMinutes())
+            except ICATSessionError as e:
+                log.debug("Current client session expired: %s", e.args)
+                login_anon_user(client)
+
         try:
-            SessionHandler.client.getRemainingMinutes()
+            return method(*args, **kwargs)
         except ICATSessionError as e:
-            log.debug("Current client session expired: %s", e.args)
-            SessionHandler.client.login("anon", {})
-
-        return method(*args, **kwargs)
+            log.debug("Client session ended before its cached expiry: %s", e.args)
+            login_anon_user(client)
+            raise
 
     return wrapper_client_manager
+
+
+def login_anon_user(client):
+    """
+    Log the client in as the anon user, clearing the session expiry time cached on the
+    client so it's fetched from ICAT when the client is next used
+
+    :param client: ICAT client used by the search API
+    :type client: :class:`ICATClient`
+    """
+    client.login("anon", {})
+    client.session_expiry = None
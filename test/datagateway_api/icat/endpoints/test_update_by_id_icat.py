@@ -1,4 +1,7 @@
+from unittest.mock import patch
+
 from datagateway_api.src.common.config import Config
+from datagateway_api.src.datagateway_api.icat.helpers import get_entity_by_id
 from test.datagateway_api.icat.test_query import prepare_icat_data_for_assertion
 
 
@@ -26,6 +29,38 @@ class TestUpdateByID:
 
         assert response_json == single_investigation_test_data
 
+    def test_valid_update_with_id_without_refetch(
+        self,
+        flask_test_app_icat,
+        valid_icat_credentials_header,
+        single_investigation_test_data,
+        monkeypatch,
+    ):
+        monkeypatch.setattr(
+            Config.config.datagateway_api, "refetch_updated_entities", False,
+        )
+        update_data_json = {
+            "doi": "Test Data Identifier",
+            "summary": "Test Summary",
+        }
+        single_investigation_test_data[0].update(update_data_json)
+
+        with patch(
+            "datagateway_api.src.datagateway_api.icat.helpers.get_entity_by_id",
+            wraps=get_entity_by_id,
+        ) as mock_get_entity_by_id:
+            test_response = flask_test_app_icat.patch(
+                f"{Config.config.datagateway_api.extension}/investigations"
+                f"/{single_investigation_test_data[0]['id']}",
+                headers=valid_icat_credentials_header,
+                json=update_data_json,
+            )
+        response_json = prepare_icat_data_for_assertion([test_response.json])
+
+        assert response_json == single_investigation_test_data
+        # The record should only be fetched before it's updated
+        mock_get_entity_by_id.assert_called_once()
+
     def test_invalid_update_with_id(
         self,
         flask_test_app_icat,
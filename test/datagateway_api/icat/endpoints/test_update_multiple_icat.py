@@ -1,6 +1,9 @@
+from unittest.mock import patch
+
 import pytest
 
 from datagateway_api.src.common.config import Config
+from datagateway_api.src.datagateway_api.icat.helpers import get_entities_by_ids
 from test.datagateway_api.icat.test_query import prepare_icat_data_for_assertion
 
 
@@ -36,6 +39,40 @@ class TestUpdateMultipleEntities:
 
         assert response_json == multiple_investigation_test_data
 
+    def test_valid_multiple_update_data_without_refetch(
+        self,
+        flask_test_app_icat,
+        valid_icat_credentials_header,
+        multiple_investigation_test_data,
+        monkeypatch,
+    ):
+        monkeypatch.setattr(
+            Config.config.datagateway_api, "refetch_updated_entities", False,
+        )
+        expected_summary = "Test Summary"
+
+        update_data_list = []
+        for investigation in multiple_investigation_test_data:
+            investigation["summary"] = expected_summary
+            update_data_list.append(
+                {"id": investigation["id"], "summary": expected_summary},
+            )
+
+        with patch(
+            "datagateway_api.src.datagateway_api.icat.helpers.get_entities_by_ids",
+            wraps=get_entities_by_ids,
+        ) as mock_get_entities_by_ids:
+            test_response = flask_test_app_icat.patch(
+                f"{Config.config.datagateway_api.extension}/investigations",
+                headers=valid_icat_credentials_header,
+                json=update_data_list,
+            )
+        response_json = prepare_icat_data_for_assertion(test_response.json)
+
+        assert response_json == multiple_investigation_test_data
+        # The records should only be fetched before they're updated
+        mock_get_entities_by_ids.assert_called_once()
+
     def test_valid_boundary_update_data(
         self,
         flask_test_app_icat,
@@ -85,6 +122,46 @@ class TestUpdateMultipleEntities:
 
         assert test_response.status_code == 400
 
+    def test_invalid_non_integer_id(
+        self,
+        flask_test_app_icat,
+        valid_icat_credentials_header,
+        single_investigation_test_data,
+    ):
+        """IDs which aren't integers shouldn't be truncated to an existing entity ID"""
+
+        update_data_json = {
+            "id": single_investigation_test_data[0]["id"] + 0.9,
+            "summary": "Test Summary",
+        }
+
+        test_response = flask_test_app_icat.patch(
+            f"{Config.config.datagateway_api.extension}/investigations",
+            headers=valid_icat_credentials_header,
+            json=update_data_json,
+        )
+
+        assert test_response.status_code == 400
+
+    def test_invalid_duplicate_ids(
+        self,
+        flask_test_app_icat,
+        valid_icat_credentials_header,
+        single_investigation_test_data,
+    ):
+        update_data_list = [
+            {"id": single_investigation_test_data[0]["id"], "doi": "Test DOI"},
+            {"id": single_investigation_test_data[0]["id"], "summary": "Test Summary"},
+        ]
+
+        test_response = flask_test_app_icat.patch(
+            f"{Config.config.datagateway_api.extension}/investigations",
+            headers=valid_icat_credentials_header,
+            json=update_data_list,
+        )
+
+        assert test_response.status_code == 400
+
     @pytest.mark.parametrize(
         "update_key, update_value",
         [
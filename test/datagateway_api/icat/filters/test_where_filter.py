@@ -10,10 +10,34 @@ class TestICATWhereFilter:
         "operation, value, expected_condition_value",
         [
             pytest.param("eq", 5, ["%s = '5'"], id="equal"),
+            pytest.param(
+                "eq", "O'Brien", ["%s = 'O''Brien'"], id="equal with quote mark",
+            ),
+            pytest.param(
+                "eq", "info.txt", ["%s = 'info.txt'"], id="equal with full stop",
+            ),
+            pytest.param(
+                "eq",
+                "o.id OR 1=1",
+                ["%s = 'o.id OR 1=1'"],
+                id="equal with JPQL identifier",
+            ),
+            pytest.param(
+                "eq",
+                "UPPER x' OR '1'='1",
+                ["%s = 'UPPER x'' OR ''1''=''1'"],
+                id="equal starting with UPPER and quote marks",
+            ),
             pytest.param("ne", 5, ["%s != '5'"], id="not equal (ne)"),
             pytest.param("neq", 5, ["%s != '5'"], id="not equal (neq)"),
             pytest.param("like", 5, ["%s like '%%5%%'"], id="like"),
             pytest.param("ilike", 5, ["UPPER(%s) like UPPER('%%5%%')"], id="ilike"),
+            pytest.param(
+                "ilike",
+                "O'Brien",
+                ["UPPER(%s) like UPPER('%%O''Brien%%')"],
+                id="ilike with quote mark",
+            ),
             pytest.param("nlike", 5, ["%s not like '%%5%%'"], id="not like"),
             pytest.param(
                 "nilike", 5, ["UPPER(%s) not like UPPER('%%5%%')"], id="not ilike",
@@ -26,6 +50,12 @@ class TestICATWhereFilter:
                 "in", [1, 2, 3, 4], ["%s in (1, 2, 3, 4)"], id="in a list (in)",
             ),
             pytest.param("in", [], ["%s in (NULL)"], id="in empty list (in)"),
+            pytest.param(
+                "in",
+                ["a", "O'Brien"],
+                ["%s in ('a', 'O''Brien')"],
+                id="in a list of strings with quote mark",
+            ),
             pytest.param(
                 "inq", [1, 2, 3, 4], ["%s in (1, 2, 3, 4)"], id="in a list (inq)",
             ),
@@ -34,7 +64,19 @@ class TestICATWhereFilter:
                 "nin", [1, 2, 3, 4], ["%s not in (1, 2, 3, 4)"], id="not in a list",
             ),
             pytest.param("nin", [], ["%s not in (NULL)"], id="not in empty list"),
+            pytest.param(
+                "nin",
+                ["a", "O'Brien"],
+                ["%s not in ('a', 'O''Brien')"],
+                id="not in a list of strings with quote mark",
+            ),
             pytest.param("between", [1, 2], ["%s between '1' and '2'"], id="between"),
+            pytest.param(
+                "between",
+                ["A", "O'Brien"],
+                ["%s between 'A' and 'O''Brien'"],
+                id="between with quote mark",
+            ),
             pytest.param("regexp", "^Test", ["%s regexp '^Test'"], id="regexp"),
         ],
     )
@@ -46,6 +88,22 @@ class TestICATWhereFilter:
 
         assert icat_query.conditions == {"id": expected_condition_value}
 
+    @pytest.mark.parametrize(
+        "operation, expected_condition_value",
+        [
+            pytest.param("eq", ["%s = o.endDate"], id="equal"),
+            pytest.param("lte", ["%s <= o.endDate"], id="less than or equal"),
+            pytest.param("gte", ["%s >= o.endDate"], id="greater than or equal"),
+        ],
+    )
+    def test_valid_raw_value(self, icat_query, operation, expected_condition_value):
+        test_filter = PythonICATWhereFilter(
+            "startDate", "o.endDate", operation, raw_value=True,
+        )
+        test_filter.apply_filter(icat_query)
+
+        assert icat_query.conditions == {"startDate": expected_condition_value}
+
     @pytest.mark.parametrize(
         "operation, value",
         [
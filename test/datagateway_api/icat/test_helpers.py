@@ -5,7 +5,9 @@ import pytest
 
 from datagateway_api.src.common.exceptions import BadRequestError, PythonICATError
 from datagateway_api.src.datagateway_api.icat.helpers import (
+    get_entities_by_ids,
     get_icat_entity_name_as_camel_case,
+    get_icat_entity_name_map,
     push_data_updates_to_icat,
 )
 
@@ -39,6 +41,17 @@ class TestICATHelpers:
         with pytest.raises(BadRequestError):
             get_icat_entity_name_as_camel_case(icat_client, "UnknownEntityName")
 
+    def test_icat_entity_name_map_cached(self, icat_client):
+        get_icat_entity_name_map(icat_client)
+
+        with patch(
+            "datagateway_api.src.datagateway_api.icat.helpers.getTypeMap",
+        ) as mock_get_type_map:
+            entity_name_map = get_icat_entity_name_map(icat_client)
+
+        mock_get_type_map.assert_not_called()
+        assert entity_name_map["publicstep"] == "publicStep"
+
     def test_invalid_update_pushes(self, icat_client):
         with patch(
             "icat.entity.Entity.update",
@@ -47,3 +60,18 @@ class TestICATHelpers:
             inv_entity = icat_client.new("investigation", name="Investigation A")
             with pytest.raises(PythonICATError):
                 push_data_updates_to_icat(inv_entity)
+
+    def test_valid_get_entities_by_ids(
+        self, icat_client, multiple_investigation_test_data,
+    ):
+        investigation_ids = [
+            investigation["id"] for investigation in multiple_investigation_test_data
+        ]
+
+        with patch("icat.client.Client.search", wraps=icat_client.search) as search:
+            investigations_by_id = get_entities_by_ids(
+                icat_client, "Investigation", investigation_ids + [-1], True,
+            )
+
+        search.assert_called_once()
+        assert sorted(investigations_by_id.keys()) == sorted(investigation_ids)
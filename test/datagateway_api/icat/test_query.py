@@ -1,4 +1,5 @@
 from datetime import datetime
+from types import GeneratorType
 
 from icat.entity import Entity
 import pytest
@@ -314,6 +315,22 @@ class TestICATQuery:
 
         assert query_data == expected_query_result
 
+    @pytest.mark.usefixtures("single_investigation_test_data")
+    def test_valid_query_execution_iter(self, icat_client):
+        test_query = ICATQuery(
+            icat_client,
+            "Investigation",
+            conditions={
+                "title": "like '%Test data for the Python ICAT Backend on"
+                " DataGateway API%'",
+            },
+        )
+
+        query_data = test_query.execute_query_iter(icat_client)
+
+        assert isinstance(query_data, GeneratorType)
+        assert list(query_data) == test_query.execute_query(icat_client, True)
+
     def test_invalid_query_execution(self, icat_client):
         test_query = ICATQuery(icat_client, "Investigation")
 
@@ -345,22 +362,21 @@ class TestICATQuery:
 
         assert test_query.get_distinct_attributes() == ["summary", "name"]
 
-    def test_include_fields_list_flatten(self, icat_client):
+    def test_include_tree(self, icat_client):
         included_field_set = {
             "investigationUsers.investigation.datasets",
+            "investigationUsers.investigation.facility",
             "userGroups",
             "instrumentScientists",
             "studies",
         }
 
         test_query = ICATQuery(icat_client, "User")
-        flat_list = test_query.flatten_query_included_fields(included_field_set)
+        include_tree = test_query.build_include_tree(included_field_set)
 
-        assert flat_list == [
-            "instrumentScientists",
-            "investigationUsers",
-            "investigation",
-            "datasets",
-            "studies",
-            "userGroups",
-        ]
+        assert include_tree == {
+            "instrumentScientists": {},
+            "investigationUsers": {"investigation": {"datasets": {}, "facility": {}}},
+            "studies": {},
+            "userGroups": {},
+        }
@@ -147,6 +147,21 @@ class TestSessionHandling:
             with pytest.raises(AuthenticationError):
                 test_backend.get_session_details("session id", client_pool=client_pool)
 
+    def test_session_expiry_cached(self):
+        test_backend = create_backend("python_icat")
+        client_pool = create_client_pool()
+        with patch(
+            "icat.client.Client.getRemainingMinutes", return_value=60,
+        ) as mock_get_remaining_minutes:
+            with patch("icat.client.Client.getUserName", return_value="Test User"):
+                for _ in range(2):
+                    test_backend.get_session_details(
+                        "cached session id", client_pool=client_pool,
+                    )
+
+        # Once per `get_session_details()` call, but only once for the decorator
+        assert mock_get_remaining_minutes.call_count == 3
+
     def test_valid_logout(self, flask_test_app_icat):
         client = Client(
             Config.config.datagateway_api.icat_url,
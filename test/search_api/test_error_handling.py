@@ -1,3 +1,4 @@
+from icat.exception import ICATSessionError
 import pytest
 
 from datagateway_api.src.common.exceptions import (
@@ -50,3 +51,24 @@ class TestErrorHandling:
 
         with pytest.raises(expected_exception):
             raise_exception()
+
+    def test_icat_session_error_retried(self):
+        calls = []
+
+        @search_api_error_handling
+        def raise_session_error():
+            calls.append(None)
+            raise ICATSessionError("Mocked Exception")
+
+        with pytest.raises(SearchAPIError) as e:
+            raise_session_error()
+
+        # The method is retried once before the error is presented as a search API
+        # error
+        assert len(calls) == 2
+        assert e.value.status_code == 500
+        assert list(e.value.args[0]["error"].keys()) == [
+            "statusCode",
+            "name",
+            "message",
+        ]
@@ -186,6 +186,24 @@ class TestPaNOSCMappings:
         )
         assert icat_relations == expected_icat_relations
 
+    def test_get_unique_icat_relations_for_panosc_non_related_fields(
+        self, test_panosc_mappings,
+    ):
+        icat_relations = test_panosc_mappings.get_unique_icat_relations_for_panosc_non_related_fields(  # noqa: B950
+            "Parameter",
+        )
+        assert icat_relations == ("type",)
+
+        with patch.object(
+            test_panosc_mappings, "get_icat_relations_for_panosc_non_related_fields",
+        ) as mock_get_icat_relations:
+            cached_icat_relations = test_panosc_mappings.get_unique_icat_relations_for_panosc_non_related_fields(  # noqa: B950
+                "Parameter",
+            )
+
+        mock_get_icat_relations.assert_not_called()
+        assert cached_icat_relations == icat_relations
+
     @pytest.mark.parametrize(
         "test_panosc_entity_name, test_entity_relation, expected_icat_relations",
         [
@@ -1,4 +1,13 @@
+from unittest.mock import patch
+
+from icat.exception import ICATSessionError
+import pytest
+
+from datagateway_api.src.common.config import Config
+from datagateway_api.src.common.exceptions import MissingRecordError
 from datagateway_api.src.datagateway_api.icat.icat_client_pool import ICATClient
+from datagateway_api.src.search_api.filters import SearchAPIWhereFilter
+from datagateway_api.src.search_api.helpers import get_search, get_with_pid
 from datagateway_api.src.search_api.session_handler import (
     client_manager,
     SessionHandler,
@@ -19,3 +28,49 @@ class TestSessionHandler:
         assert not SessionHandler.client.sessionId
         manage_client()
         assert SessionHandler.client.sessionId
+
+    def test_client_manager_session_expiry_cached(self):
+        @client_manager
+        def manage_client():
+            pass
+
+        # Ensures the client is logged in and its session expiry has been cached
+        manage_client()
+        manage_client()
+        with patch(
+            "icat.client.Client.getRemainingMinutes",
+        ) as mock_get_remaining_minutes:
+            manage_client()
+
+        mock_get_remaining_minutes.assert_not_called()
+
+    def test_client_manager_ended_session(self):
+        # Ensures the client is logged in and its session expiry has been cached
+        get_search("Dataset", [SearchAPIWhereFilter("pid", "Test PID", "eq")])
+        # Simulates the session ending before its cached expiry time
+        SessionHandler.client.sessionId = "Invalid Session ID"
+
+        with pytest.raises(ICATSessionError):
+            get_with_pid("Dataset", "Test PID", [])
+
+        assert SessionHandler.client.sessionId != "Invalid Session ID"
+        # Filters are created for each request, so a following request with a WHERE
+        # filter shouldn't be affected by the session ending
+        with pytest.raises(MissingRecordError):
+            get_with_pid("Dataset", "Test PID", [])
+
+    def test_search_endpoint_ended_session(self, flask_test_app_search_api):
+        request_filter = '{"where": {"pid": "0-8401-1070-7"}}'
+        request_url = (
+            f"{Config.config.search_api.extension}/datasets?filter={request_filter}"
+        )
+        # Ensures the client is logged in and its session expiry has been cached
+        flask_test_app_search_api.get(request_url)
+        # Simulates the session ending before its cached expiry time
+        SessionHandler.client.sessionId = "Invalid Session ID"
+
+        test_response = flask_test_app_search_api.get(request_url)
+
+        # The request should be retried with filters created again from the request
+        assert test_response.status_code == 200
+        assert [dataset["pid"] for dataset in test_response.json] == ["0-8401-1070-7"]
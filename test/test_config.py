@@ -30,6 +30,12 @@ class TestAPIConfig:
             with pytest.raises(SystemExit):
                 APIConfig.load("test/path")
 
+    def test_load_with_missing_refetch_updated_entities(self, test_config_data):
+        with patch("builtins.open", mock_open(read_data=json.dumps(test_config_data))):
+            test_config = APIConfig.load("test/path")
+
+        assert test_config.datagateway_api.refetch_updated_entities
+
     def test_load_with_datagateway_api_icat_backend_and_missing_icat_config_data(
         self, test_config_data,
     ):
@@ -61,6 +67,27 @@ class TestAPIConfig:
             with pytest.raises(SystemExit):
                 APIConfig.load("test/path")
 
+    def test_load_with_invalid_log_level(self, test_config_data):
+        test_config_data["log_level"] = "VERBOSE"
+        with patch("builtins.open", mock_open(read_data=json.dumps(test_config_data))):
+            with pytest.raises(SystemExit):
+                APIConfig.load("test/path")
+
+    @pytest.mark.parametrize(
+        "port",
+        [
+            pytest.param("port", id="Non-numeric port"),
+            pytest.param("-1", id="Negative port"),
+            pytest.param("0", id="Zero port"),
+            pytest.param("65536", id="Port above valid range"),
+        ],
+    )
+    def test_load_with_invalid_port(self, test_config_data, port):
+        test_config_data["port"] = port
+        with patch("builtins.open", mock_open(read_data=json.dumps(test_config_data))):
+            with pytest.raises(SystemExit):
+                APIConfig.load("test/path")
+
     def test_set_backend_type(self, test_config):
         test_config.datagateway_api.set_backend_type("backend_name_changed")
 
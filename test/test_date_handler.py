@@ -1,5 +1,6 @@
 from datetime import datetime
 
+from dateutil.tz import tzlocal, tzutc
 import pytest
 
 from datagateway_api.src.common.date_handler import DateHandler
@@ -71,3 +72,15 @@ class TestDatetimeToStr:
         )
         str_date_output = DateHandler.datetime_object_to_str(example_date)
         assert str_date_output == "2020-02-29 23:59:59"
+
+
+class TestAddLocalTimezone:
+    def test_naive_datetime(self):
+        example_date = datetime(year=2008, month=10, day=15)
+        timezone_date = DateHandler.add_local_timezone(example_date)
+        assert timezone_date == example_date.replace(tzinfo=tzlocal())
+
+    def test_datetime_with_timezone(self):
+        example_date = datetime(year=2008, month=10, day=15, tzinfo=tzutc())
+        timezone_date = DateHandler.add_local_timezone(example_date)
+        assert timezone_date.tzinfo == tzutc()
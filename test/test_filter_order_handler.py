@@ -4,9 +4,15 @@ from datagateway_api.src.common.filter_order_handler import FilterOrderHandler
 from datagateway_api.src.datagateway_api.icat.filters import (
     PythonICATIncludeFilter,
     PythonICATLimitFilter,
+    PythonICATOrderFilter,
+    PythonICATSkipFilter,
     PythonICATWhereFilter,
 )
-from datagateway_api.src.search_api.filters import SearchAPIIncludeFilter
+from datagateway_api.src.search_api.filters import (
+    SearchAPIIncludeFilter,
+    SearchAPIWhereFilter,
+)
+from datagateway_api.src.search_api.nested_where_filters import NestedWhereFilters
 
 
 class TestFilterOrderHandler:
@@ -73,6 +79,46 @@ class TestFilterOrderHandler:
             10,
         )
 
+    def test_classify_python_icat_filters(self):
+        skip_filter = PythonICATSkipFilter(5)
+        limit_filter = PythonICATLimitFilter(10)
+        order_filter = PythonICATOrderFilter("id", "asc")
+        where_filter = PythonICATWhereFilter("id", 2, "eq")
+
+        test_handler = FilterOrderHandler()
+        test_handler.add_filters(
+            [where_filter, limit_filter, order_filter, skip_filter],
+        )
+
+        assert test_handler.classify_python_icat_filters() == (
+            skip_filter,
+            limit_filter,
+            True,
+        )
+
+    def test_classify_python_icat_filters_without_managed_filters(self):
+        test_handler = FilterOrderHandler()
+        test_handler.add_filter(PythonICATWhereFilter("id", 2, "eq"))
+
+        assert test_handler.classify_python_icat_filters() == (None, None, False)
+
+    def test_classify_python_icat_filters_with_nested_where_filters(self):
+        nested_where_filter = NestedWhereFilters(
+            SearchAPIWhereFilter("title", "Test", "eq"),
+            SearchAPIWhereFilter("summary", "Test", "eq"),
+            "or",
+        )
+        limit_filter = PythonICATLimitFilter(10)
+
+        test_handler = FilterOrderHandler()
+        test_handler.add_filters([nested_where_filter, limit_filter])
+
+        assert test_handler.classify_python_icat_filters() == (
+            None,
+            limit_filter,
+            False,
+        )
+
     @pytest.mark.parametrize(
         "test_panosc_entity_name, test_filters, expected_filters_length,"
         "expected_num_of_python_include_filters, expected_icat_relations",